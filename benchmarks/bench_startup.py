@@ -0,0 +1,116 @@
+# EUI 启动基准：对比解释执行与 --compile 生成模块的构建耗时和首帧绘制耗时
+# 用法：python benchmarks/bench_startup.py [--rows 300] [--repeat 5] [--offscreen]
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+# ---------------------- 生成大表单 ----------------------
+def generate_form(rows):
+    # 分组框之后的组件都会放入最后一个分组，因此只建一个顶层分组，保持表单扁平
+    lines = ['window=title="大表单基准",width=900,height=700',
+             'groupbox=title="表单",id=form']
+    for i in range(rows):
+        lines.append(f'label=text="第{i}行",id=l{i}')
+        lines.append(f'entry=hint="输入{i}",id=e{i},type=number')
+        lines.append(f'combo=label="选项{i}",id=c{i},options=["A","B","C"]')
+        lines.append(f'checkbox=label="多选{i}",id=k{i},options=["X","Y"]')
+        lines.append(f'slider=label="滑块{i}",id=s{i},min=0,max=100,value=50')
+        lines.append(f'progress=label="进度{i}",id=p{i},min=0,max=100,value=0')
+        lines.append(f'timer=id=t{i},interval=100,action="update_progress=p{i},step=5"')
+        lines.append(f'button=text="开始{i}",id=b{i},click="start_timer=t{i}"')
+        lines.append(f'button=text="显示{i}",id=v{i},click="显示=e{i}"')
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------- 子进程：单次测量 ----------------------
+def measure(mode, path):
+    start = time.perf_counter()
+    from PyQt5.QtCore import QObject, QEvent, QTimer
+    from easy_ui_interpreter import EasyUIInterpreter
+
+    ui = EasyUIInterpreter()
+    ui._setup_runtime()
+    if mode == "interpreted":
+        with open(path, 'r', encoding='utf-8') as f:
+            code = f.read()
+        for line in [line.strip() for line in code.split('\n') if line.strip()]:
+            ui.parse_line(line)
+    else:
+        import importlib
+        sys.path.insert(0, os.path.dirname(path))
+        module = importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+        module.build(ui)
+    built = time.perf_counter()
+
+    result = {}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'first_paint_ms' not in result:
+                result['first_paint_ms'] = (time.perf_counter() - start) * 1000
+                QTimer.singleShot(0, ui.app.quit)
+            return False
+
+    watcher = PaintWatcher()
+    ui.app.installEventFilter(watcher)
+    QTimer.singleShot(10000, ui.app.quit)
+    ui._finish_window()
+    ui.app.exec_()
+
+    result['build_ms'] = (built - start) * 1000
+    print(json.dumps(result))
+
+
+# ---------------------- 主进程：重复运行并汇总 ----------------------
+def run_child(mode, path, env):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, path],
+        capture_output=True, text=True, env=env, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--offscreen", action="store_true")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"))
+    args = parser.parse_args()
+
+    if args.child:
+        measure(*args.child)
+        return
+
+    from easy_ui_interpreter import compile_file
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOT_DIR, env.get('PYTHONPATH')]))
+    if args.offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_path = os.path.join(tmp_dir, "bench_form.eui")
+        with open(source_path, 'w', encoding='utf-8') as f:
+            f.write(generate_form(args.rows))
+        compiled_path = compile_file(source_path, os.path.join(tmp_dir, "bench_form_compiled.py"))
+
+        print(f"表单行数：{args.rows}，重复次数：{args.repeat}")
+        for mode, path in (("interpreted", source_path), ("compiled", compiled_path)):
+            runs = [run_child(mode, path, env) for _ in range(args.repeat)]
+            build = statistics.median(r['build_ms'] for r in runs)
+            paint = statistics.median(r.get('first_paint_ms', float('nan')) for r in runs)
+            print(f"{mode:<12} 构建 {build:8.1f} ms    首帧 {paint:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
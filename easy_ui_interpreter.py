@@ -1,19 +1,133 @@
 import sys
 import os
 import re
+import signal
+import subprocess
+import threading
+import importlib
+import py_compile
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QLineEdit, 
                             QComboBox, QCheckBox, QPushButton, QWidget, 
                             QVBoxLayout, QHBoxLayout, QMessageBox, QFrame,
                             QTextEdit, QSlider, QProgressBar, QCalendarWidget,
                             QGroupBox, QRadioButton)
-from PyQt5.QtCore import Qt, QUrl, QTimer, pyqtSlot
+from PyQt5.QtCore import (Qt, QUrl, QTimer, pyqtSignal, QObject,
+                          QThreadPool, QRunnable)
 from PyQt5.QtGui import QIcon, QIntValidator, QPixmap, QImage
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 from urllib.request import urlopen
 from io import BytesIO
 
+# --compile 生成代码中表示"该动作无需处理"，避免运行时再解析动作字符串
+NO_HANDLER = object()
+
+# ---------------------- 后台任务 ----------------------
+# 工作线程不能直接操作界面组件，进度/输出通过信号排队回到GUI线程
+class TaskSignals(QObject):
+    progress = pyqtSignal(str, int)   # 任务ID, 进度值
+    output = pyqtSignal(str, str)     # 任务ID, 输出文本
+    finished = pyqtSignal(str, int)   # 任务ID, 退出码（-1表示已取消）
+
+
+class TaskRunnable(QRunnable):
+    # 命令输出中形如 progress=40 的行视为进度，其余行写入输出区域
+    PROGRESS_PATTERN = re.compile(r'^\s*progress\s*=\s*(\d+)\s*$')
+
+    def __init__(self, task_id, kind, target, signals, cwd=None):
+        super().__init__()
+        self.task_id = task_id
+        self.kind = kind          # cmd: 外部命令；call: Python函数（模块:函数名）
+        self.target = target
+        self.signals = signals
+        self.cwd = cwd            # 命令工作目录，默认为EUI文件所在目录
+        self.cancel_event = threading.Event()
+        self.process = None
+        self.done = False
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self.cancel_event.set()
+        self.kill_process_tree()
+
+    # 命令经由shell启动，只结束shell无法结束其子进程，因此按进程组整体结束。
+    # shell退出后其子进程仍可能占用输出管道，所以不以shell是否存活为准
+    def kill_process_tree(self):
+        process = self.process
+        if not process or self.done:
+            return
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/T', '/F', '/PID', str(process.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        except (OSError, subprocess.SubprocessError):
+            process.kill()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def report_progress(self, value):
+        self.signals.progress.emit(self.task_id, int(value))
+
+    def write_output(self, text):
+        self.signals.output.emit(self.task_id, str(text))
+
+    def run(self):
+        code = 0
+        try:
+            if self.is_cancelled():
+                code = -1
+            elif self.kind == "cmd":
+                code = self._run_command()
+            else:
+                code = self._run_callable()
+        except Exception as e:
+            self.write_output(f"任务执行失败：{str(e)}")
+            code = 1
+        if self.is_cancelled():
+            code = -1
+        self.done = True
+        self.signals.finished.emit(self.task_id, code)
+
+    def _run_command(self):
+        if os.name == 'nt':
+            group_options = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group_options = {'start_new_session': True}
+        self.process = subprocess.Popen(
+            self.target, shell=True, cwd=self.cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding='utf-8', errors='replace', bufsize=1, **group_options
+        )
+        if self.is_cancelled():
+            self.kill_process_tree()
+        for line in self.process.stdout:
+            if self.is_cancelled():
+                break
+            line = line.rstrip('\r\n')
+            progress_match = self.PROGRESS_PATTERN.match(line)
+            if progress_match:
+                self.report_progress(progress_match.group(1))
+            else:
+                self.write_output(line)
+        self.process.stdout.close()
+        return self.process.wait()
+
+    def _run_callable(self):
+        # 函数签名：func(progress, output, cancelled)，返回值为退出码（None视为0）
+        module_name, _, func_name = self.target.partition(":")
+        func = getattr(importlib.import_module(module_name), func_name)
+        result = func(self.report_progress, self.write_output, self.is_cancelled)
+        return int(result) if isinstance(result, int) else 0
+
+
 # ---------------------- 核心解释器类 ----------------------
 class EasyUIInterpreter:
+    DEFAULT_MAX_TASKS = 2  # 同时运行的后台任务上限
+    TASK_SHUTDOWN_TIMEOUT = 3000  # 关闭窗口时等待后台任务结束的毫秒数
+
     def __init__(self):
         self.app = None
         self.window = None
@@ -23,8 +137,29 @@ class EasyUIInterpreter:
         self.media_players = {}
         self.timers = {}  # 存储定时器
         self.groups = {}
+        self.tasks = {}  # 存储后台任务
+        self.base_dir = None  # EUI文件所在目录：cmd=的工作目录，call=的模块查找路径
+        self.task_pool = None
+        self.task_signals = None
 
     def parse_and_run(self, code):
+        self._setup_runtime()
+        lines = [line.strip() for line in code.split('\n') if line.strip()]
+        for line in lines:
+            self.parse_line(line)
+        self._finish_window()
+        sys.exit(self.app.exec_())
+
+    # 运行 --compile 生成的模块：build(ui) 直接调用创建方法，无需解析源码
+    def run_compiled(self, build, base_dir=None):
+        if base_dir:
+            self.set_base_dir(base_dir)
+        self._setup_runtime()
+        build(self)
+        self._finish_window()
+        sys.exit(self.app.exec_())
+
+    def _setup_runtime(self):
         if not QApplication.instance():
             self.app = QApplication(sys.argv)
         else:
@@ -36,26 +171,42 @@ class EasyUIInterpreter:
         self.media_players = {}
         self.timers = {}
         self.groups = {}
+        self.tasks = {}
+        self.task_pool = QThreadPool()
+        self.task_pool.setMaxThreadCount(self.DEFAULT_MAX_TASKS)
+        self.task_signals = TaskSignals()
+        self.task_signals.progress.connect(self.handle_task_progress, Qt.QueuedConnection)
+        self.task_signals.output.connect(self.handle_task_output, Qt.QueuedConnection)
+        self.task_signals.finished.connect(self.handle_task_finished, Qt.QueuedConnection)
+        self.app.aboutToQuit.connect(self._shutdown_tasks)
         self.window = None
         self.main_layout = None
-        
-        lines = [line.strip() for line in code.split('\n') if line.strip()]
-        for line in lines:
-            self.parse_line(line)
-        
+
+    def set_base_dir(self, base_dir):
+        self.base_dir = os.path.abspath(base_dir)
+        if self.base_dir not in sys.path:
+            sys.path.insert(0, self.base_dir)
+
+    def _finish_window(self):
         if not self.window:
             self.create_window("EUI默认窗口", 400, 300)
         else:
             self.main_layout.addStretch()
         
         self.window.show()
-        sys.exit(self.app.exec_())
 
     # ---------------------- 解析逻辑 ----------------------
     def parse_line(self, line):
+        statement = self.parse_statement(line)
+        if statement:
+            method_name, args = statement
+            getattr(self, method_name)(*args)
+
+    # 将一行EUI代码解析为 (创建方法名, 参数)，解释执行与 --compile 代码生成共用
+    def parse_statement(self, line):
         line = line.strip().rstrip(';')
         if not line:
-            return
+            return None
 
         # 窗口配置
         window_pattern = r'window\s*=\s*title="([^"]+)"\s*,\s*width=(\d+)\s*,\s*height=(\d+)(?:\s*,\s*icon="([^"]+)")?'
@@ -65,14 +216,12 @@ class EasyUIInterpreter:
             width = int(window_match.group(2))
             height = int(window_match.group(3))
             icon_path = window_match.group(4) if window_match.group(4) else None
-            self.create_window(title, width, height, icon_path)
-            return
+            return ("create_window", (title, width, height, icon_path))
 
         # 文字标签
         label_match = re.match(r'label\s*=\s*text="([^"]+)"\s*,\s*id=(\w+)', line)
         if label_match:
-            self.create_label(label_match.group(1), label_match.group(2))
-            return
+            return ("create_label", (label_match.group(1), label_match.group(2)))
 
         # 输入框
         entry_pattern = r'entry\s*=\s*hint="([^"]+)"\s*,\s*id=(\w+)(?:\s*,\s*readonly=(true|false))?(?:\s*,\s*type=(number|text))?'
@@ -82,35 +231,30 @@ class EasyUIInterpreter:
             widget_id = entry_match.group(2)
             readonly = entry_match.group(3).lower() == 'true' if entry_match.group(3) else False
             input_type = entry_match.group(4) if entry_match.group(4) else 'text'
-            self.create_entry(hint, widget_id, readonly, input_type)
-            return
+            return ("create_entry", (hint, widget_id, readonly, input_type))
 
         # 下拉选择框
         combo_match = re.match(r'combo\s*=\s*label="([^"]+)"\s*,\s*id=(\w+)\s*,\s*options=\[(.*?)\]', line)
         if combo_match:
             options = [opt.strip().strip('"') for opt in combo_match.group(3).split(',') if opt.strip()]
-            self.create_combobox(combo_match.group(1), combo_match.group(2), options)
-            return
+            return ("create_combobox", (combo_match.group(1), combo_match.group(2), options))
 
         # 多选框组
         check_match = re.match(r'checkbox\s*=\s*label="([^"]+)"\s*,\s*id=(\w+)\s*,\s*options=\[(.*?)\]', line)
         if check_match:
             options = [opt.strip().strip('"') for opt in check_match.group(3).split(',') if opt.strip()]
-            self.create_checkboxes(check_match.group(1), check_match.group(2), options)
-            return
+            return ("create_checkboxes", (check_match.group(1), check_match.group(2), options))
 
         # 按钮
         button_match = re.match(r'button\s*=\s*text="([^"]+)"\s*,\s*id=(\w+)\s*,\s*click="([^"]+)"', line)
         if button_match:
-            self.create_button(button_match.group(1), button_match.group(2), button_match.group(3))
-            return
+            return ("create_button", (button_match.group(1), button_match.group(2), button_match.group(3)))
 
         # 音频播放器
         audio_pattern = r'audio\s*=\s*(url|os)="([^"]+)"\s*,\s*id=(\w+)'
         audio_match = re.match(audio_pattern, line)
         if audio_match:
-            self.create_audio_player(audio_match.group(1), audio_match.group(2), audio_match.group(3))
-            return
+            return ("create_audio_player", (audio_match.group(1), audio_match.group(2), audio_match.group(3)))
 
         # 图片组件解析 - 支持path、url、os三种格式
         image_pattern = r'image\s*=\s*(path|url|os)="([^"]+)"\s*,\s*id=(\w+)(?:\s*,\s*width=(\d+))?(?:\s*,\s*height=(\d+))?(?:\s*,\s*tooltip="([^"]+)")?'
@@ -122,68 +266,75 @@ class EasyUIInterpreter:
             width = int(image_match.group(4)) if image_match.group(4) else None  # 可选宽度
             height = int(image_match.group(5)) if image_match.group(5) else None  # 可选高度
             tooltip = image_match.group(6) if image_match.group(6) else ""  # 可选提示文本
-            self.create_image(img_type, img_path, img_id, width, height, tooltip)
-            return
+            return ("create_image", (img_type, img_path, img_id, width, height, tooltip))
 
         # 滑块控件
         slider_pattern = r'slider\s*=\s*label="([^"]+)"\s*,\s*id=(\w+)\s*,\s*min=(\d+)\s*,\s*max=(\d+)\s*,\s*value=(\d+)'
         slider_match = re.match(slider_pattern, line)
         if slider_match:
-            self.create_slider(
+            return ("create_slider", (
                 slider_match.group(1), slider_match.group(2),
                 int(slider_match.group(3)), int(slider_match.group(4)), int(slider_match.group(5))
-            )
-            return
+            ))
 
         # 文本区域
         textarea_pattern = r'textarea\s*=\s*label="([^"]+)"\s*,\s*id=(\w+)\s*,\s*rows=(\d+)(?:\s*,\s*readonly=(true|false))?'
         textarea_match = re.match(textarea_pattern, line)
         if textarea_match:
             readonly = textarea_match.group(4).lower() == 'true' if textarea_match.group(4) else False
-            self.create_textarea(textarea_match.group(1), textarea_match.group(2), int(textarea_match.group(3)), readonly)
-            return
+            return ("create_textarea", (textarea_match.group(1), textarea_match.group(2), int(textarea_match.group(3)), readonly))
 
         # 分隔线
         separator_match = re.match(r'separator\s*=\s*text="([^"]*)"\s*,\s*id=(\w+)', line)
         if separator_match:
-            self.create_separator(separator_match.group(1), separator_match.group(2))
-            return
+            return ("create_separator", (separator_match.group(1), separator_match.group(2)))
 
         # 进度条
         progress_pattern = r'progress\s*=\s*label="([^"]+)"\s*,\s*id=(\w+)\s*,\s*min=(\d+)\s*,\s*max=(\d+)\s*,\s*value=(\d+)'
         progress_match = re.match(progress_pattern, line)
         if progress_match:
-            self.create_progressbar(
+            return ("create_progressbar", (
                 progress_match.group(1), progress_match.group(2),
                 int(progress_match.group(3)), int(progress_match.group(4)), int(progress_match.group(5))
-            )
-            return
+            ))
 
         # 日历控件
         calendar_match = re.match(r'calendar\s*=\s*label="([^"]+)"\s*,\s*id=(\w+)', line)
         if calendar_match:
-            self.create_calendar(calendar_match.group(1), calendar_match.group(2))
-            return
+            return ("create_calendar", (calendar_match.group(1), calendar_match.group(2)))
 
         # 单选按钮组
         radio_match = re.match(r'radiogroup\s*=\s*label="([^"]+)"\s*,\s*id=(\w+)\s*,\s*options=\[(.*?)\]', line)
         if radio_match:
             options = [opt.strip().strip('"') for opt in radio_match.group(3).split(',') if opt.strip()]
-            self.create_radiogroup(radio_match.group(1), radio_match.group(2), options)
-            return
+            return ("create_radiogroup", (radio_match.group(1), radio_match.group(2), options))
 
         # 分组框
         groupbox_match = re.match(r'groupbox\s*=\s*title="([^"]+)"\s*,\s*id=(\w+)', line)
         if groupbox_match:
-            self.create_groupbox(groupbox_match.group(1), groupbox_match.group(2))
-            return
+            return ("create_groupbox", (groupbox_match.group(1), groupbox_match.group(2)))
 
         # 定时器
         timer_pattern = r'timer\s*=\s*id=(\w+)\s*,\s*interval=(\d+)\s*,\s*action="([^"]+)"'
         timer_match = re.match(timer_pattern, line)
         if timer_match:
-            self.create_timer(timer_match.group(1), int(timer_match.group(2)), timer_match.group(3))
-            return
+            return ("create_timer", (timer_match.group(1), int(timer_match.group(2)), timer_match.group(3)))
+
+        # 后台任务
+        task_pattern = r'task\s*=\s*id=(\w+)\s*,\s*(cmd|call)="([^"]+)"(?:\s*,\s*progress=(\w+))?(?:\s*,\s*output=(\w+))?'
+        task_match = re.match(task_pattern, line)
+        if task_match:
+            return ("create_task", (
+                task_match.group(1), task_match.group(2), task_match.group(3),
+                task_match.group(4), task_match.group(5)
+            ))
+
+        # 后台任务并发上限
+        taskpool_match = re.match(r'taskpool\s*=\s*max=(\d+)', line)
+        if taskpool_match:
+            return ("set_task_pool_size", (int(taskpool_match.group(1)),))
+
+        return None
 
     # ---------------------- 组件创建方法 ----------------------
     def create_window(self, title, width, height, icon_path=None):
@@ -279,14 +430,18 @@ class EasyUIInterpreter:
         self.widgets[widget_id] = checkboxes
         self.variables[widget_id] = checkboxes
 
-    def create_button(self, text, widget_id, action):
+    def create_button(self, text, widget_id, action, handler=None):
         if not self.window:
             self.create_window("默认窗口", 400, 300)
         
         button = QPushButton(text)
         button.setMinimumHeight(30)
         button.setMaximumWidth(150)
-        button.clicked.connect(lambda checked, a=action: self.handle_button_click(a))
+        # 动作在创建时解析一次，点击时直接调用
+        if handler is None:
+            handler = self._bind(self._resolve_action(action))
+        if callable(handler):
+            button.clicked.connect(lambda checked, h=handler: h())
         self._get_current_layout().addWidget(button, alignment=Qt.AlignLeft)
         self.widgets[widget_id] = button
 
@@ -534,86 +689,108 @@ class EasyUIInterpreter:
         self.groups[group_id] = group_layout
         self.widgets[group_id] = groupbox
 
-    def create_timer(self, timer_id, interval, action):
+    def create_timer(self, timer_id, interval, action, handler=None):
         if timer_id in self.timers:
             self.timers[timer_id]['timer'].stop()
             
         timer = QTimer()
         timer.setInterval(interval)
-        timer.timeout.connect(lambda: self.handle_timer_timeout(timer_id))
+        if handler is None:
+            handler = self._bind(self._resolve_timer_action(timer_id, action))
+        if callable(handler):
+            timer.timeout.connect(handler)
         self.timers[timer_id] = {
             'timer': timer, 
             'action': action
         }
 
+    def set_task_pool_size(self, max_tasks):
+        self.task_pool.setMaxThreadCount(max(1, max_tasks))
+
+    def create_task(self, task_id, kind, target, progress_id=None, output_id=None):
+        self.tasks[task_id] = {
+            'kind': kind,
+            'target': target,
+            'progress': progress_id,
+            'output': output_id,
+            'runnable': None
+        }
+
     # ---------------------- 事件处理 ----------------------
     def _get_current_layout(self):
         return list(self.groups.values())[-1] if self.groups else self.main_layout
 
-    @pyqtSlot()
-    def handle_timer_timeout(self, timer_id):
-        if timer_id not in self.timers:
-            return
-            
-        timer_info = self.timers[timer_id]
-        action = timer_info['action']
-        
+    # 将定时器/按钮动作字符串解析为 (处理方法名, 参数)，解释执行与 --compile 代码生成共用
+    def _resolve_timer_action(self, timer_id, action):
         if action.startswith("update_progress="):
+            parts = action.split(",")
+            if len(parts) != 2 or "=" not in parts[1]:
+                return ("_warn", ("定时器错误", f"更新进度条失败：动作格式错误 {action}"))
             try:
-                progress_part, step_part = action.split(",")
-                progress_id = progress_part.split("=")[1].strip()
-                step = int(step_part.split("=")[1].strip())
-                
-                progress_bar = self.widgets.get(progress_id)
-                if not progress_bar or not isinstance(progress_bar, QProgressBar):
-                    return
-                
-                current_value = progress_bar.value()
-                new_value = current_value + step
-                new_value = max(progress_bar.minimum(), min(progress_bar.maximum(), new_value))
-                progress_bar.setValue(new_value)
-                
-                if new_value >= progress_bar.maximum():
-                    timer_info['timer'].stop()
-                    
-            except Exception as e:
-                QMessageBox.warning(self.window, "定时器错误", f"更新进度条失败：{str(e)}")
+                step = int(parts[1].split("=")[1].strip())
+            except ValueError as e:
+                return ("_warn", ("定时器错误", f"更新进度条失败：{str(e)}"))
+            return ("_step_progress", (timer_id, parts[0].split("=")[1].strip(), step))
+        return None
 
-    def handle_button_click(self, action):
+    def _resolve_action(self, action):
         if action.startswith("play_audio="):
-            self._control_audio(action.split("=")[1], "play")
-            return
+            return ("_control_audio", (action.split("=")[1], "play"))
         if action.startswith("pause_audio="):
-            self._control_audio(action.split("=")[1], "pause")
-            return
+            return ("_control_audio", (action.split("=")[1], "pause"))
         if action.startswith("stop_audio="):
-            self._control_audio(action.split("=")[1], "stop")
-            return
+            return ("_control_audio", (action.split("=")[1], "stop"))
         
         if action.startswith("start_timer="):
-            timer_id = action.split("=")[1].strip()
-            self._control_timer(timer_id, "start")
-            return
+            return ("_control_timer", (action.split("=")[1].strip(), "start"))
         if action.startswith("stop_timer="):
-            timer_id = action.split("=")[1].strip()
-            self._control_timer(timer_id, "stop")
-            return
+            return ("_control_timer", (action.split("=")[1].strip(), "stop"))
+        
+        if action.startswith("run_task="):
+            return ("_run_task", (action.split("=")[1].strip(),))
+        if action.startswith("cancel_task="):
+            return ("_cancel_task", (action.split("=")[1].strip(),))
         
         if action.startswith("set_progress="):
             parts = action.split(",")
             if len(parts) >= 2 and parts[1].startswith("value="):
                 try:
-                    p_id = parts[0].split("=")[1].strip()
                     val = int(parts[1].split("=")[1].strip())
-                    if p_id in self.widgets and isinstance(self.widgets[p_id], QProgressBar):
-                        self.widgets[p_id].setValue(val)
-                except Exception as e:
-                    QMessageBox.warning(self.window, "错误", f"设置进度条失败：{str(e)}")
-            return
+                except ValueError as e:
+                    return ("_warn", ("错误", f"设置进度条失败：{str(e)}"))
+                return ("_set_progress", (parts[0].split("=")[1].strip(), val))
+            return None
         
         if action.startswith("显示="):
-            self._show_widget_value(action.split("=")[1].strip())
+            return ("_show_widget_value", (action.split("=")[1].strip(),))
+        return None
+
+    def _bind(self, resolved):
+        if not resolved:
+            return None
+        method_name, args = resolved
+        method = getattr(self, method_name)
+        return lambda: method(*args)
+
+    def _warn(self, title, message):
+        QMessageBox.warning(self.window, title, message)
+
+    def _step_progress(self, timer_id, progress_id, step):
+        progress_bar = self.widgets.get(progress_id)
+        if not progress_bar or not isinstance(progress_bar, QProgressBar):
             return
+        
+        current_value = progress_bar.value()
+        new_value = current_value + step
+        new_value = max(progress_bar.minimum(), min(progress_bar.maximum(), new_value))
+        progress_bar.setValue(new_value)
+        
+        if new_value >= progress_bar.maximum() and timer_id in self.timers:
+            self.timers[timer_id]['timer'].stop()
+
+    def _set_progress(self, progress_id, value):
+        if progress_id in self.widgets and isinstance(self.widgets[progress_id], QProgressBar):
+            self.widgets[progress_id].setValue(value)
 
     def _control_audio(self, audio_id, action):
         if audio_id not in self.media_players:
@@ -636,6 +813,84 @@ class EasyUIInterpreter:
         elif action == "stop":
             timer.stop()
 
+    def _run_task(self, task_id):
+        if task_id not in self.tasks:
+            QMessageBox.warning(self.window, "警告", f"任务ID不存在：{task_id}")
+            return
+        task_info = self.tasks[task_id]
+        if task_info['runnable']:
+            QMessageBox.warning(self.window, "警告", f"任务正在运行：{task_id}")
+            return
+        
+        progress_bar = self.widgets.get(task_info['progress'])
+        if isinstance(progress_bar, QProgressBar):
+            progress_bar.setValue(progress_bar.minimum())
+        textarea = self.widgets.get(task_info['output'])
+        if isinstance(textarea, QTextEdit):
+            textarea.clear()
+        
+        runnable = TaskRunnable(task_id, task_info['kind'], task_info['target'], self.task_signals, self.base_dir)
+        task_info['runnable'] = runnable
+        self.task_pool.start(runnable)
+
+    def _cancel_task(self, task_id):
+        if task_id not in self.tasks:
+            QMessageBox.warning(self.window, "警告", f"任务ID不存在：{task_id}")
+            return
+        runnable = self.tasks[task_id]['runnable']
+        if not runnable:
+            return
+        runnable.cancel()
+        # 尚在排队的任务直接移出线程池
+        if self.task_pool.tryTake(runnable):
+            self.handle_task_finished(task_id, -1)
+
+    def _shutdown_tasks(self):
+        runnables = [info['runnable'] for info in self.tasks.values() if info['runnable']]
+        for runnable in runnables:
+            runnable.cancel()
+        self.task_pool.clear()
+        if self.task_pool.waitForDone(self.TASK_SHUTDOWN_TIMEOUT):
+            return
+        # 超时后再次结束仍存活的进程树；仍无法结束的任务（如不检查cancelled()的call=函数）
+        # 无法在线程内强行中止，直接以非零退出码结束进程，避免窗口卡死
+        for runnable in runnables:
+            runnable.kill_process_tree()
+        if not self.task_pool.waitForDone(self.TASK_SHUTDOWN_TIMEOUT):
+            stuck = [f"{r.task_id}（{r.kind}）" for r in runnables if not r.done]
+            print(f"[EUI解释器错误]：后台任务在超时内未能结束，强制退出：{', '.join(stuck)}", file=sys.stderr)
+            os._exit(1)
+
+    def handle_task_progress(self, task_id, value):
+        task_info = self.tasks.get(task_id)
+        if not task_info:
+            return
+        progress_bar = self.widgets.get(task_info['progress'])
+        if isinstance(progress_bar, QProgressBar):
+            progress_bar.setValue(max(progress_bar.minimum(), min(progress_bar.maximum(), value)))
+
+    def handle_task_output(self, task_id, text):
+        task_info = self.tasks.get(task_id)
+        if not task_info:
+            return
+        textarea = self.widgets.get(task_info['output'])
+        if isinstance(textarea, QTextEdit):
+            textarea.append(text)
+
+    def handle_task_finished(self, task_id, code):
+        task_info = self.tasks.get(task_id)
+        if not task_info or not task_info['runnable']:
+            return
+        task_info['runnable'] = None
+        if code == -1:
+            self.handle_task_output(task_id, f"[任务已取消：{task_id}]")
+        else:
+            if code == 0:
+                progress_bar = self.widgets.get(task_info['progress'])
+                if isinstance(progress_bar, QProgressBar):
+                    progress_bar.setValue(progress_bar.maximum())
+            self.handle_task_output(task_id, f"[任务结束：{task_id}，退出码 {code}]")
+
     def _show_widget_value(self, widget_id):
         if widget_id not in self.variables:
             QMessageBox.warning(self.window, "警告", f"组件ID不存在：{widget_id}")
@@ -668,14 +923,80 @@ class EasyUIInterpreter:
         
         QMessageBox.information(self.window, "组件值", msg)
 
+    # ---------------------- AOT编译 ----------------------
+    # 生成直接调用创建方法的Python模块，按钮/定时器动作在生成时即绑定为具体处理方法
+    def compile_code(self, code, source_name="<eui>"):
+        body = []
+        lines = [line.strip() for line in code.split('\n') if line.strip()]
+        for line in lines:
+            statement = self.parse_statement(line)
+            if not statement:
+                continue
+            method_name, args = statement
+            handler = None
+            if method_name == "create_button":
+                handler = self._compile_handler(self._resolve_action(args[2]))
+            elif method_name == "create_timer":
+                handler = self._compile_handler(self._resolve_timer_action(args[0], args[2]))
+            call_args = [repr(arg) for arg in args]
+            if method_name in ("create_button", "create_timer"):
+                call_args.append(handler)
+            body.append(f"    ui.{method_name}({', '.join(call_args)})")
+        
+        return "\n".join([
+            "# -*- coding: utf-8 -*-",
+            f"# 由 easy_ui_interpreter.py --compile 从 {source_name} 生成，请勿手动修改",
+            "import os",
+            "from easy_ui_interpreter import EasyUIInterpreter, NO_HANDLER",
+            "",
+            "",
+            "def build(ui):",
+            *(body or ["    pass"]),
+            "",
+            "",
+            'if __name__ == "__main__":',
+            "    EasyUIInterpreter().run_compiled(build, os.path.dirname(os.path.abspath(__file__)))",
+            "",
+        ])
+
+    def _compile_handler(self, resolved):
+        if not resolved:
+            return "NO_HANDLER"
+        method_name, args = resolved
+        return f"lambda: ui.{method_name}({', '.join(repr(arg) for arg in args)})"
+
+
+def compile_file(source_path, output_path=None):
+    if not output_path:
+        output_path = os.path.splitext(source_path)[0] + ".py"
+    with open(source_path, 'r', encoding='utf-8') as f:
+        code = f.read()
+    module_code = EasyUIInterpreter().compile_code(code, os.path.basename(source_path))
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(module_code)
+    # 同时生成字节码（__pycache__），可直接分发
+    py_compile.compile(output_path, doraise=True)
+    return output_path
+
 # ---------------------- 运行入口 ----------------------
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 1 and sys.argv[1] == "--compile":
+        if len(sys.argv) < 3:
+            print("用法：python easy_ui_interpreter.py --compile <EWUI文件路径> [输出.py]", file=sys.stderr)
+            sys.exit(2)
+        try:
+            output_path = compile_file(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+            print(f"[EUI编译完成]：{output_path}")
+        except Exception as e:
+            print(f"[EUI编译错误]：{str(e)}", file=sys.stderr)
+            sys.exit(1)
+    elif len(sys.argv) > 1:
         file_path = sys.argv[1]
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 ewui_code = f.read()
                 interpreter = EasyUIInterpreter()
+                interpreter.set_base_dir(os.path.dirname(os.path.abspath(file_path)))
                 interpreter.parse_and_run(ewui_code)
         except Exception as e:
             print(f"[EUI解释器错误]：{str(e)}", file=sys.stderr)
@@ -684,6 +1005,7 @@ if __name__ == "__main__":
         print("=" * 50)
         print("Easy UI 解释器（支持path图片语法版）")
         print("用法：python easy_ui_interpreter.py <EWUI文件路径>")
+        print("编译：python easy_ui_interpreter.py --compile <EWUI文件路径> [输出.py]")
         print("图片组件用法示例：")
         print("window=title=\"图片示例\",width=800,height=600")
         print("image=path=\"https://www.baidu.com/img/bd_logo1.png\",id=img1,width=300,tooltip=\"百度Logo\"")
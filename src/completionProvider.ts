@@ -9,7 +9,9 @@ const keywordCompletions: vscode.CompletionItem[] = [
   { label: 'image', kind: vscode.CompletionItemKind.Keyword, detail: '图片' },
   { label: 'combo', kind: vscode.CompletionItemKind.Keyword, detail: '下拉框' },
   { label: 'slider', kind: vscode.CompletionItemKind.Keyword, detail: '滑块' },
-  { label: 'timer', kind: vscode.CompletionItemKind.Keyword, detail: '定时器' }
+  { label: 'timer', kind: vscode.CompletionItemKind.Keyword, detail: '定时器' },
+  { label: 'task', kind: vscode.CompletionItemKind.Keyword, detail: '后台任务' },
+  { label: 'taskpool', kind: vscode.CompletionItemKind.Keyword, detail: '后台任务并发上限' }
 ];
 
 // 参数补全项（按关键词分组）
@@ -28,6 +30,13 @@ const paramCompletions: Record<string, vscode.CompletionItem[]> = {
     { label: 'path', kind: vscode.CompletionItemKind.Field, detail: '图片路径' },
     { label: 'url', kind: vscode.CompletionItemKind.Field, detail: '图片URL' },
     { label: 'width', kind: vscode.CompletionItemKind.Field, detail: '宽度' }
+  ],
+  'task': [
+    { label: 'id', kind: vscode.CompletionItemKind.Field, detail: '任务ID' },
+    { label: 'cmd', kind: vscode.CompletionItemKind.Field, detail: '外部命令' },
+    { label: 'call', kind: vscode.CompletionItemKind.Field, detail: 'Python函数（模块:函数名）' },
+    { label: 'progress', kind: vscode.CompletionItemKind.Field, detail: '进度条ID' },
+    { label: 'output', kind: vscode.CompletionItemKind.Field, detail: '输出文本区域ID' }
   ]
 };
 
@@ -35,7 +44,9 @@ const paramCompletions: Record<string, vscode.CompletionItem[]> = {
 const actionCompletions: vscode.CompletionItem[] = [
   { label: 'play_audio=', kind: vscode.CompletionItemKind.Function, detail: '播放音频' },
   { label: '显示=', kind: vscode.CompletionItemKind.Function, detail: '显示组件值' },
-  { label: 'start_timer=', kind: vscode.CompletionItemKind.Function, detail: '启动定时器' }
+  { label: 'start_timer=', kind: vscode.CompletionItemKind.Function, detail: '启动定时器' },
+  { label: 'run_task=', kind: vscode.CompletionItemKind.Function, detail: '运行后台任务' },
+  { label: 'cancel_task=', kind: vscode.CompletionItemKind.Function, detail: '取消后台任务' }
 ];
 
 export class EUICompletionProvider implements vscode.CompletionItemProvider {
@@ -76,7 +76,9 @@ export function activate(context: vscode.ExtensionContext) {
 
     // 5. 执行EUI文件
     try {
-      const process = cp.spawn(pythonPath, [interpreterPath, fileName]);
+      const process = cp.spawn(pythonPath, [interpreterPath, fileName], {
+        cwd: path.dirname(fileName)  // task=的相对路径以EUI文件所在目录为准
+      });
 
       // 输出Python日志（调试用）
       process.stdout.on('data', (data) => {